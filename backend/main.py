@@ -1,12 +1,24 @@
-from fastapi import FastAPI, HTTPException, Header, UploadFile, File, Form, Query
+from fastapi import Depends, FastAPI, HTTPException, UploadFile, File, Form, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse, FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse, FileResponse
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from fastapi.staticfiles import StaticFiles
 from typing import Optional
-from openai import OpenAI, AsyncOpenAI
+from openai import AsyncOpenAI
 import httpx
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, field_validator
+import asyncio
+import hashlib
+import json
+import logging
+import logging.handlers
 import os
+import queue
+import time
+import redis.asyncio as aioredis
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from pathlib import Path
 from dotenv import load_dotenv
 import cv2
@@ -19,27 +31,274 @@ import base64
 # Load environment variables
 load_dotenv()
 
+# Log through a queue so handler IO happens on a background thread and
+# never blocks the event loop inside async handlers
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+
+logger = logging.getLogger("sora")
+logger.setLevel(os.getenv("LOG_LEVEL", "INFO"))
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+
 # Optional custom API key configuration
 CUSTOM_API_KEY_NAME = os.getenv("CUSTOM_API_KEY_NAME")  # e.g., "GIFT-2024-SPECIAL"
 CUSTOM_API_KEY_VALUE = os.getenv("CUSTOM_API_KEY_VALUE")  # e.g., "sk-..."
 
-app = FastAPI(title="Sora API Playground")
+# 128 KiB chunks for streamed downloads
+DOWNLOAD_CHUNK_SIZE = 128 * 1024
+
+# Download variant -> (media type, file extension)
+VARIANT_META = {
+    "video": ("video/mp4", "mp4"),
+    "thumbnail": ("image/webp", "webp"),
+    "spritesheet": ("image/jpeg", "jpg")
+}
+
+# Optional Redis response cache. Browsers poll video status every 1-2s during
+# generation, so even very short TTLs shed most of the duplicate upstream
+# traffic. Caching is disabled when REDIS_URL is not set.
+REDIS_URL = os.getenv("REDIS_URL")
+STATUS_CACHE_TTL_ACTIVE = 2    # queued / in_progress videos
+STATUS_CACHE_TTL_FINAL = 60    # completed / failed videos
+STATUS_CACHE_STALE_TTL = 300   # fallback copy served when upstream errors
+IMPROVE_CACHE_TTL = 86400      # improved prompts are deterministic enough to keep for a day
+
+# Bump whenever SYSTEM_PROMPT changes so stale cached improvements
+# are invalidated
+SYSTEM_PROMPT_VERSION = "v1"
+
+# System prompt for /api/prompts/improve, built once at import instead of
+# per request
+SYSTEM_PROMPT = """You are an expert at crafting prompts for OpenAI's Sora video generation model. Your job is to take a user's basic prompt and enhance it following the official Sora 2 Prompting Guide.
+
+CORE PRINCIPLES:
+
+1. CLARITY OVER VAGUENESS
+Transform vague descriptions into concrete, filmable details:
+- "beautiful street" → "wet asphalt, zebra crosswalk, neon signs reflecting in puddles"
+- "person moves" → "cyclist pedals three times, brakes at crosswalk"
+- "cinematic look" → "anamorphic 2.0x lens, shallow DOF, volumetric light"
+
+2. CAMERA & FRAMING
+Be specific about camera work:
+- Framing: wide establishing shot, medium close-up, aerial shot, etc.
+- Angle: eye level, low angle, slight downward angle, over-shoulder
+- Movement: slowly tilting camera, handheld ENG camera, slow dolly left, tracking shot
+- Depth of field: shallow (sharp subject, blurred background) or deep focus
+
+3. LIGHTING & COLOR
+Describe lighting with precision:
+- Quality: soft window light, hard single source, diffuse overhead
+- Direction: warm backlight, cool rim from hallway, key from camera left
+- Palette: Include 3-5 color anchors (amber, cream, walnut brown, slate blue, etc.)
+
+4. VISUAL STYLE & ERA
+Set a clear aesthetic tone:
+- Film types: "1970s film on 35mm," "16mm black-and-white documentary," "90s documentary-style"
+- Look: "hand-painted 2D/3D hybrid," "IMAX-scale," "vintage commercial"
+- Technical: "180° shutter," "slight gate weave," "natural flares," "soft focus"
+
+5. ACTION & TIMING
+Keep motion simple and break actions into clear beats:
+- One camera move + one subject action per shot
+- Use specific counts: "takes four steps to window, pauses, pulls curtain in final second"
+- Describe gestures precisely: "taps bulb; sparks crackle; flinches; drops bulb; catches it"
+
+6. MOTION CONTROL
+The model follows instructions more reliably in shorter clips. Keep shots concise with single, clear actions.
+
+7. DIALOGUE & SOUND
+- Format dialogue in a separate section below the prose
+- Keep lines brief and natural
+- Label speakers consistently in multi-character scenes
+- Background sound: suggest ambient audio (rain, traffic hiss, espresso machine hum)
+
+RECOMMENDED STRUCTURE:
+
+[Optional: Style note - film era, aesthetic, technical specs]
+
+[Prose scene description with specific visual details - characters, setting, weather, costumes]
+
+Cinematography:
+Camera shot: [specific framing and angle]
+Lens: [if relevant - 35mm, 50mm, etc.]
+Lighting: [quality, direction, and source]
+Mood: [overall tone]
+
+Actions:
+- [Action 1: specific beat with timing]
+- [Action 2: another clear gesture]
+- [Action 3: final movement or pause]
+
+Dialogue: [if applicable]
+- [Character name]: "[Brief, natural line]"
+- [Character name]: "[Response]"
+
+Background Sound: [if applicable]
+[Ambient audio cues - keep minimal and diegetic]
+
+IMPORTANT NOTES:
+- Shorter, lighter prompts give the model creative freedom (expect surprising results)
+- Longer, detailed prompts provide control but may not always be followed perfectly
+- Avoid describing multiple shots unless needed - focus on one clear shot
+- Characters: Keep descriptions consistent to maintain identity
+- Leave some details open for creative interpretation unless control is critical
+
+Return ONLY the improved prompt following this structure. No meta-commentary or explanations."""
+
+_redis: Optional[aioredis.Redis] = None
+
+
+def get_redis() -> Optional[aioredis.Redis]:
+    """Lazily connect to Redis; returns None when caching is disabled"""
+    global _redis
+    if not REDIS_URL:
+        return None
+    if _redis is None:
+        _redis = aioredis.from_url(REDIS_URL, decode_responses=True)
+    return _redis
+
+
+async def cache_get(key: str) -> Optional[str]:
+    """Read a cached JSON body; treat any Redis error as a cache miss"""
+    redis = get_redis()
+    if redis is None:
+        return None
+    try:
+        return await redis.get(key)
+    except Exception as e:
+        logger.warning(f"Redis get failed for {key}: {e}")
+        return None
+
+
+async def cache_set(key: str, body: str, ttl: int, stale_ttl: Optional[int] = None):
+    """Store a JSON body, optionally with a longer-lived stale copy for error fallback"""
+    redis = get_redis()
+    if redis is None:
+        return
+    try:
+        pipe = redis.pipeline()
+        pipe.setex(key, ttl, body)
+        if stale_ttl:
+            pipe.setex(f"{key}:stale", stale_ttl, body)
+        await pipe.execute()
+    except Exception as e:
+        logger.warning(f"Redis set failed for {key}: {e}")
+
+
+async def cache_delete(key: str):
+    """Drop a cached body and its stale copy (e.g. after a delete)"""
+    redis = get_redis()
+    if redis is None:
+        return
+    try:
+        await redis.delete(key, f"{key}:stale")
+    except Exception as e:
+        logger.warning(f"Redis delete failed for {key}: {e}")
+
+
+# Requests per minute allowed per API key before upstream dispatch is
+# throttled. Smooths bursts (gallery refreshes, polling) into a steady rate
+# so OpenAI 429s don't cascade back to clients as 500s. Per-process; scale
+# the budget down if running many workers.
+OPENAI_RPM = int(os.getenv("OPENAI_RPM", "300"))
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at rate_per_min, with ~10s of burst"""
 
-# CORS middleware for local development and production
-# In production, Railway will handle the domain
+    def __init__(self, rate_per_min: int):
+        self.rate = rate_per_min / 60.0
+        self.capacity = float(max(10, rate_per_min // 6))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: int = 1):
+        """Wait until the requested tokens are available, then consume them"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self.tokens) / self.rate)
+
+
+_rate_buckets: dict[str, TokenBucket] = {}
+
+
+async def acquire_openai_slot(client: AsyncOpenAI, tokens: int = 1):
+    """Throttle upstream dispatch on this client's API key"""
+    bucket = _rate_buckets.get(client.api_key)
+    if bucket is None:
+        bucket = _rate_buckets[client.api_key] = TokenBucket(OPENAI_RPM)
+    await bucket.acquire(tokens)
+
+
+def video_cache_key(client: AsyncOpenAI, video_id: str) -> str:
+    """Status cache key scoped to the resolved API key so tenants never share entries"""
+    key_hash = hashlib.sha256(client.api_key.encode()).hexdigest()[:16]
+    return f"vid:{key_hash}:{video_id}"
+
+
+def status_cache_ttl(status: str) -> int:
+    """Terminal states are immutable and can be cached longer"""
+    return STATUS_CACHE_TTL_FINAL if status in ("completed", "failed") else STATUS_CACHE_TTL_ACTIVE
+
+
+# Cache one AsyncOpenAI client per resolved API key so the underlying httpx
+# connection pool (and its TLS handshakes) is reused across requests.
+# Bounded LRU so a flood of bad keys can't grow the cache without limit.
+MAX_CACHED_CLIENTS = int(os.getenv("MAX_CACHED_CLIENTS", "32"))
+_client_cache: OrderedDict[str, AsyncOpenAI] = OrderedDict()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Close pooled HTTP connections on shutdown
+    for client in _client_cache.values():
+        await client.close()
+    _client_cache.clear()
+    # Flush any queued log records before the process exits
+    _log_listener.stop()
+
+
+# orjson serializes the JSON bodies (status polling in particular) several
+# times faster than the stdlib encoder and emits bytes directly
+app = FastAPI(title="Sora API Playground", lifespan=lifespan,
+              default_response_class=ORJSONResponse)
+
+# CORS middleware for local development and production.
+# An explicit origin list (no "*") lets the middleware short-circuit
+# preflights and is required for allow_credentials to be meaningful.
 allowed_origins = ["http://localhost:5173", "http://localhost:3000"]
 # Allow Railway domain if RAILWAY_STATIC_URL is set
 if railway_url := os.getenv("RAILWAY_STATIC_URL"):
     allowed_origins.append(f"https://{railway_url}")
+# Extra origins via env, e.g. CORS_ORIGINS=https://example.com,https://app.example.com
+if cors_origins := os.getenv("CORS_ORIGINS"):
+    allowed_origins.extend(o.strip() for o in cors_origins.split(",") if o.strip())
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=allowed_origins + ["*"],  # Allow all in production for Railway
+    allow_origins=allowed_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,  # let browsers cache preflights for 24h
 )
 
+# Compress JSON bodies above 500 bytes; repetitive status payloads (and the
+# SSE stream, which stays chunk-flushed) shrink 5-10x on the wire. Media
+# responses opt out via Content-Encoding: identity — video/image bytes are
+# already compressed and clients need the Content-Length for progress.
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
 
 class VideoCreateRequest(BaseModel):
     prompt: str
@@ -61,26 +320,101 @@ class ImageGenerateRequest(BaseModel):
     size: str  # Video size format: 720x1280, 1280x720, 1024x1024, 1280x1280
 
 
-def get_openai_client(api_key: str) -> OpenAI:
+class VideoStatus(BaseModel):
+    """Video status shape the frontend expects, validated straight off the SDK object"""
+    # protected_namespaces cleared because the SDK object has a `model` field
+    model_config = ConfigDict(from_attributes=True, protected_namespaces=())
+
+    id: str
+    object: str
+    model: str
+    status: str
+    progress: Optional[int] = 0
+    created_at: int
+    size: Optional[str] = None
+    seconds: Optional[str] = None
+    completed_at: Optional[int] = None
+    expires_at: Optional[int] = None
+    error: Optional[dict] = None
+    remixed_from_video_id: Optional[str] = None
+
+    @field_validator("error", mode="before")
+    @classmethod
+    def _dump_error(cls, value):
+        # The SDK surfaces errors as a nested model; flatten to a plain dict
+        return value.model_dump() if hasattr(value, "model_dump") else value
+
+
+class VideoListResponse(BaseModel):
+    object: str = "list"
+    data: list[VideoStatus] = []
+
+
+# Parses the Authorization header once, in Starlette, instead of string
+# munging in every handler
+bearer_scheme = HTTPBearer(auto_error=False)
+
+
+def get_openai_client(credentials: Optional[HTTPAuthorizationCredentials]) -> AsyncOpenAI:
     """
-    Create OpenAI client with user's API key
+    Create async OpenAI client with the user's API key
 
     Supports custom gift codes via environment variables:
     - If CUSTOM_API_KEY_NAME is set and matches the provided key,
       uses CUSTOM_API_KEY_VALUE as the actual OpenAI API key
     """
-    if not api_key or not api_key.startswith("Bearer "):
+    if credentials is None or not credentials.credentials:
         raise HTTPException(status_code=401, detail="Invalid API key format. Use 'Bearer sk-...'")
 
-    key = api_key.replace("Bearer ", "")
+    key = credentials.credentials
 
     # Check if this is a custom gift code
     if CUSTOM_API_KEY_NAME and CUSTOM_API_KEY_VALUE:
         if key == CUSTOM_API_KEY_NAME:
-            print(f"Using custom API key for gift code: {CUSTOM_API_KEY_NAME}")
+            logger.debug("Using custom API key for gift code")
             key = CUSTOM_API_KEY_VALUE
 
-    return OpenAI(api_key=key)
+    # Reuse a cached client (and its connection pool) for this key
+    client = _client_cache.get(key)
+    if client is not None:
+        _client_cache.move_to_end(key)
+        return client
+
+    # HTTP/2 multiplexes concurrent calls (the list_videos fan-out
+    # especially) over a handful of connections instead of one socket per
+    # in-flight request
+    client = AsyncOpenAI(
+        api_key=key,
+        http_client=httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=200,
+                max_keepalive_connections=100,
+                keepalive_expiry=30.0
+            ),
+            timeout=httpx.Timeout(60.0, connect=5.0)
+        )
+    )
+    _client_cache[key] = client
+    if len(_client_cache) > MAX_CACHED_CLIENTS:
+        evicted_key, evicted = _client_cache.popitem(last=False)
+        _rate_buckets.pop(evicted_key, None)
+        asyncio.create_task(evicted.close())
+    return client
+
+
+async def fetch_video_status(client: AsyncOpenAI, video_id: str) -> dict:
+    """Get the current status of a video, served from cache when fresh"""
+    cache_key = video_cache_key(client, video_id)
+    if (cached := await cache_get(cache_key)) is not None:
+        return json.loads(cached)
+
+    await acquire_openai_slot(client)
+    video = await client.videos.retrieve(video_id)
+    status = VideoStatus.model_validate(video)
+    await cache_set(cache_key, status.model_dump_json(exclude_none=True), status_cache_ttl(status.status),
+                    stale_ttl=STATUS_CACHE_STALE_TTL)
+    return status.model_dump(exclude_none=True)
 
 
 def map_video_size_to_image_size(video_size: str) -> str:
@@ -99,14 +433,14 @@ def map_video_size_to_image_size(video_size: str) -> str:
     return size_map.get(video_size, "1024x1024")
 
 
-@app.post("/api/videos")
+@app.post("/api/videos", response_model=VideoStatus, response_model_exclude_none=True)
 async def create_video(
     prompt: str = Form(...),
     model: str = Form("sora-2"),
     seconds: str = Form("4"),
     size: str = Form("720x1280"),
     input_reference: Optional[UploadFile] = File(None),
-    authorization: str = Header(...)
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme)
 ):
     """
     Create a new video generation job
@@ -119,7 +453,7 @@ async def create_video(
     - input_reference: Optional image file to use as first frame
     """
     try:
-        client = get_openai_client(authorization)
+        client = get_openai_client(credentials)
 
         # Prepare request parameters
         params = {
@@ -129,34 +463,32 @@ async def create_video(
             "size": size
         }
 
-        # Handle file upload if provided
+        # Handle file upload if provided: pass the underlying spooled temp
+        # file so httpx streams the multipart body instead of buffering the
+        # whole image in memory
         if input_reference:
-            file_content = await input_reference.read()
-            file_tuple = (input_reference.filename, file_content, input_reference.content_type)
-            params["input_reference"] = file_tuple
+            params["input_reference"] = (
+                input_reference.filename,
+                input_reference.file,
+                input_reference.content_type
+            )
 
         # Create video job
-        video = client.videos.create(**params)
+        await acquire_openai_slot(client)
+        video = await client.videos.create(**params)
 
-        return {
-            "id": video.id,
-            "object": video.object,
-            "model": video.model,
-            "status": video.status,
-            "progress": getattr(video, "progress", 0),
-            "created_at": video.created_at,
-            "size": video.size,
-            "seconds": video.seconds
-        }
+        return video
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/api/videos/{video_id}")
+@app.get("/api/videos/{video_id}", response_model=VideoStatus, response_model_exclude_none=True)
 async def get_video_status(
     video_id: str,
-    authorization: str = Header(...)
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme)
 ):
     """
     Get the status and progress of a video generation job
@@ -164,42 +496,126 @@ async def get_video_status(
     Returns job details including status (queued, in_progress, completed, failed)
     and progress percentage if available.
     """
+    # Validate credentials before touching the cache so unauthenticated
+    # requests can never read cached state
+    client = get_openai_client(credentials)
+
+    cache_key = video_cache_key(client, video_id)
+    if (cached := await cache_get(cache_key)) is not None:
+        return Response(content=cached, media_type="application/json",
+                        headers={"X-Cache": "HIT"})
+
     try:
-        client = get_openai_client(authorization)
-        video = client.videos.retrieve(video_id)
-
-        response = {
-            "id": video.id,
-            "object": video.object,
-            "model": video.model,
-            "status": video.status,
-            "progress": getattr(video, "progress", 0),
-            "created_at": video.created_at,
-            "size": video.size,
-            "seconds": video.seconds
-        }
+        await acquire_openai_slot(client)
+        video = await client.videos.retrieve(video_id)
+
+    except Exception as e:
+        # Serve the last known state if the upstream API is erroring
+        if (stale := await cache_get(f"{cache_key}:stale")) is not None:
+            return Response(content=stale, media_type="application/json",
+                            headers={"X-Cache": "STALE"})
+        raise HTTPException(status_code=500, detail=str(e))
 
-        # Add optional fields if present
-        if hasattr(video, "completed_at"):
-            response["completed_at"] = video.completed_at
-        if hasattr(video, "expires_at"):
-            response["expires_at"] = video.expires_at
-        if hasattr(video, "error"):
-            response["error"] = video.error
-        if hasattr(video, "remixed_from_video_id"):
-            response["remixed_from_video_id"] = video.remixed_from_video_id
+    status = VideoStatus.model_validate(video)
+    await cache_set(cache_key, status.model_dump_json(exclude_none=True), status_cache_ttl(status.status),
+                    stale_ttl=STATUS_CACHE_STALE_TTL)
+    return status
 
-        return response
 
+@app.get("/api/videos/{video_id}/wait")
+async def wait_for_video_update(
+    video_id: str,
+    timeout: float = Query(25.0, ge=1.0, le=25.0, description="Max seconds to hold the request"),
+    since_status: Optional[str] = Query(None, description="Return as soon as status differs from this"),
+    since_progress: Optional[int] = Query(None, description="Return as soon as progress exceeds this"),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme)
+):
+    """
+    Long-poll for a video status change
+
+    Holds the request open until the status differs from `since_status`,
+    the progress exceeds `since_progress`, or `timeout` seconds elapse,
+    then returns the current status. Lets clients replace 1 Hz polling
+    loops with one request per state change.
+    """
+    try:
+        client = get_openai_client(credentials)
+        deadline = asyncio.get_running_loop().time() + timeout
+
+        while True:
+            state = await fetch_video_status(client, video_id)
+            if since_status is not None and state["status"] != since_status:
+                return state
+            if since_progress is not None and (state.get("progress") or 0) > since_progress:
+                return state
+            if since_status is None and since_progress is None:
+                return state
+            if asyncio.get_running_loop().time() >= deadline - 1.0:
+                return state
+            await asyncio.sleep(1.0)
+
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/videos/{video_id}/events")
+async def stream_video_events(
+    video_id: str,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme)
+):
+    """
+    Stream video status updates as Server-Sent Events
+
+    Emits a `data:` event whenever the status or progress changes and
+    closes the stream once the video completes or fails. One persistent
+    connection replaces the per-second polling loop entirely. Heartbeat
+    comments are sent every 15s to keep proxies from closing the stream.
+    """
+    client = get_openai_client(credentials)
+
+    async def event_gen():
+        loop = asyncio.get_running_loop()
+        last_state = None
+        last_sent = loop.time()
+
+        while True:
+            try:
+                state = await fetch_video_status(client, video_id)
+            except Exception as e:
+                yield f"event: error\ndata: {json.dumps({'detail': str(e)})}\n\n"
+                return
+
+            if state != last_state:
+                yield f"data: {json.dumps(state)}\n\n"
+                last_state = state
+                last_sent = loop.time()
+
+            if state["status"] in ("completed", "failed"):
+                return
+
+            if loop.time() - last_sent >= 15.0:
+                yield ": heartbeat\n\n"
+                last_sent = loop.time()
+
+            await asyncio.sleep(0.5)
+
+    return StreamingResponse(
+        event_gen(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"
+        }
+    )
+
+
 @app.get("/api/videos/{video_id}/content")
 async def download_video_content(
     video_id: str,
     variant: str = Query("video", description="video, thumbnail, or spritesheet"),
-    authorization: str = Header(...)
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme)
 ):
     """
     Download the video content (MP4), thumbnail (WebP), or spritesheet (JPG)
@@ -208,36 +624,50 @@ async def download_video_content(
     - variant: Type of content to download (video, thumbnail, spritesheet)
     """
     try:
-        client = get_openai_client(authorization)
-
-        # Use the download_content method with variant
-        content = client.videos.download_content(video_id, variant=variant)
-
-        # Determine content type based on variant
-        content_type_map = {
-            "video": "video/mp4",
-            "thumbnail": "image/webp",
-            "spritesheet": "image/jpeg"
+        client = get_openai_client(credentials)
+
+        # Stream the download so the full file (potentially hundreds of MB
+        # for video) is never buffered in memory
+        await acquire_openai_slot(client)
+        response = await client.videos.with_streaming_response.download_content(
+            video_id, variant=variant
+        ).__aenter__()
+
+        # Determine content type and file extension based on variant
+        content_type, extension = VARIANT_META.get(variant, ("application/octet-stream", "bin"))
+
+        headers = {
+            "Content-Disposition": f'attachment; filename="{video_id}.{variant}.{extension}"',
+            # Keep GZipMiddleware away from the already-compressed media bytes
+            "Content-Encoding": "identity"
         }
-        content_type = content_type_map.get(variant, "application/octet-stream")
+        # Forward upstream Content-Length so clients can show download progress
+        if content_length := response.headers.get("content-length"):
+            headers["Content-Length"] = content_length
+
+        async def stream_content():
+            try:
+                async for chunk in response.iter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    yield chunk
+            finally:
+                await response.close()
 
-        # Return as streaming response
         return StreamingResponse(
-            iter([content.read()]),
+            stream_content(),
             media_type=content_type,
-            headers={
-                "Content-Disposition": f'attachment; filename="{video_id}.{variant}.{"mp4" if variant == "video" else "webp" if variant == "thumbnail" else "jpg"}"'
-            }
+            headers=headers
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/api/videos")
+@app.get("/api/videos", response_model=VideoListResponse, response_model_exclude_none=True)
 async def list_videos(
     video_ids: Optional[str] = Query(None, description="Comma-separated list of video IDs"),
-    authorization: str = Header(...)
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme)
 ):
     """
     Get status for specific videos by ID
@@ -249,7 +679,7 @@ async def list_videos(
     to support multi-user scenarios with shared API keys.
     """
     try:
-        client = get_openai_client(authorization)
+        client = get_openai_client(credentials)
 
         if not video_ids:
             # Return empty list if no IDs provided
@@ -261,33 +691,34 @@ async def list_videos(
         # Split comma-separated IDs
         ids = [vid.strip() for vid in video_ids.split(",") if vid.strip()]
 
+        # Fetch all videos concurrently; cap the fan-out so a large gallery
+        # doesn't slam the upstream rate limit
+        semaphore = asyncio.Semaphore(16)
+
+        async def retrieve_video(vid: str) -> dict:
+            async with semaphore:
+                return await fetch_video_status(client, vid)
+
+        results = await asyncio.gather(
+            *(retrieve_video(vid) for vid in ids),
+            return_exceptions=True
+        )
+
         videos_data = []
-        for video_id in ids:
-            try:
-                video = client.videos.retrieve(video_id)
-                videos_data.append({
-                    "id": video.id,
-                    "object": video.object,
-                    "model": video.model,
-                    "status": video.status,
-                    "progress": getattr(video, "progress", 0),
-                    "created_at": video.created_at,
-                    "size": getattr(video, "size", None),
-                    "seconds": getattr(video, "seconds", None),
-                    "completed_at": getattr(video, "completed_at", None),
-                    "error": getattr(video, "error", None),
-                    "remixed_from_video_id": getattr(video, "remixed_from_video_id", None)
-                })
-            except Exception as e:
+        for video_id, video in zip(ids, results):
+            if isinstance(video, Exception):
                 # Skip videos that can't be retrieved (deleted, etc.)
-                print(f"Failed to retrieve video {video_id}: {e}")
+                logger.warning(f"Failed to retrieve video {video_id}: {video}")
                 continue
+            videos_data.append(video)
 
         return {
             "object": "list",
             "data": videos_data
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -295,27 +726,31 @@ async def list_videos(
 @app.delete("/api/videos/{video_id}")
 async def delete_video(
     video_id: str,
-    authorization: str = Header(...)
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme)
 ):
     """Delete a video from OpenAI storage"""
     try:
-        client = get_openai_client(authorization)
-        result = client.videos.delete(video_id)
+        client = get_openai_client(credentials)
+        await acquire_openai_slot(client)
+        result = await client.videos.delete(video_id)
+        await cache_delete(video_cache_key(client, video_id))
 
         return {
             "id": video_id,
             "deleted": True
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/videos/{video_id}/remix")
+@app.post("/api/videos/{video_id}/remix", response_model=VideoStatus, response_model_exclude_none=True)
 async def remix_video(
     video_id: str,
     request: RemixRequest,
-    authorization: str = Header(...)
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme)
 ):
     """
     Create a remix of an existing completed video
@@ -325,25 +760,21 @@ async def remix_video(
     - prompt: New prompt describing the changes to make
     """
     try:
-        client = get_openai_client(authorization)
+        client = get_openai_client(credentials)
 
-        video = client.videos.remix(
+        await acquire_openai_slot(client)
+        video = await client.videos.remix(
             video_id=video_id,
             prompt=request.prompt
         )
 
-        return {
-            "id": video.id,
-            "object": video.object,
-            "model": video.model,
-            "status": video.status,
-            "progress": getattr(video, "progress", 0),
-            "created_at": video.created_at,
-            "size": video.size,
-            "seconds": video.seconds,
-            "remixed_from_video_id": getattr(video, "remixed_from_video_id", video_id)
-        }
+        status = VideoStatus.model_validate(video)
+        if status.remixed_from_video_id is None:
+            status.remixed_from_video_id = video_id
+        return status
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -352,7 +783,7 @@ async def remix_video(
 async def extract_video_frame(
     video_id: str,
     position: str = Query("first", description="Frame position: 'first' or 'last'"),
-    authorization: str = Header(...)
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme)
 ):
     """
     Extract the first or last frame from a video
@@ -364,18 +795,20 @@ async def extract_video_frame(
     Returns the frame as a PNG image
     """
     try:
-        client = get_openai_client(authorization)
-
-        # Download the video content
-        content = client.videos.download_content(video_id, variant="video")
-        video_bytes = content.read()
+        client = get_openai_client(credentials)
 
-        # Save to temporary file
+        # Stream the video straight to a temporary file for OpenCV, so the
+        # MP4 is never held in memory
+        await acquire_openai_slot(client)
         with tempfile.NamedTemporaryFile(delete=False, suffix=".mp4") as temp_video:
-            temp_video.write(video_bytes)
             temp_video_path = temp_video.name
 
         try:
+            async with client.videos.with_streaming_response.download_content(
+                video_id, variant="video"
+            ) as content:
+                await content.stream_to_file(temp_video_path)
+
             # Open video with OpenCV
             cap = cv2.VideoCapture(temp_video_path)
 
@@ -410,7 +843,8 @@ async def extract_video_frame(
                 io.BytesIO(img_byte_arr.getvalue()),
                 media_type="image/png",
                 headers={
-                    "Content-Disposition": f'attachment; filename="{video_id}_{position}_frame.png"'
+                    "Content-Disposition": f'attachment; filename="{video_id}_{position}_frame.png"',
+                    "Content-Encoding": "identity"
                 }
             )
 
@@ -418,6 +852,8 @@ async def extract_video_frame(
             # Clean up temporary file
             os.unlink(temp_video_path)
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -427,7 +863,7 @@ async def generate_image(
     prompt: str = Form(...),
     size: str = Form(...),
     reference_images: list[UploadFile] = File(None),
-    authorization: str = Header(...)
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme)
 ):
     """
     Generate an image using gpt-image-1 API with optional reference images
@@ -443,11 +879,11 @@ async def generate_image(
     Returns the generated image as PNG bytes
     """
     try:
-        client = get_openai_client(authorization)
+        client = get_openai_client(credentials)
 
         # Map video size to image size
         image_size = map_video_size_to_image_size(size)
-        print(f"Generating image: video size {size} -> image size {image_size}")
+        logger.info(f"Generating image: video size {size} -> image size {image_size}")
 
         # Build input content for Responses API
         input_content = []
@@ -457,7 +893,7 @@ async def generate_image(
 
         # Add reference images if provided
         if reference_images:
-            print(f"Processing {len(reference_images)} reference images")
+            logger.info(f"Processing {len(reference_images)} reference images")
             for idx, ref_image in enumerate(reference_images):
                 if ref_image:
                     # Read image and encode as base64
@@ -472,10 +908,11 @@ async def generate_image(
                         "type": "input_image",
                         "image_url": f"data:{content_type};base64,{image_base64}"
                     })
-                    print(f"Added reference image {idx + 1}: {ref_image.filename}")
+                    logger.debug(f"Added reference image {idx + 1}: {ref_image.filename}")
 
         # Generate image using gpt-image-1 via Responses API
-        response = client.responses.create(
+        await acquire_openai_slot(client)
+        response = await client.responses.create(
             model="gpt-5",
             input=[{
                 "role": "user",
@@ -545,10 +982,13 @@ async def generate_image(
             output_bytes,
             media_type="image/png",
             headers={
-                "Content-Disposition": f'attachment; filename="generated_image.png"'
+                "Content-Disposition": f'attachment; filename="generated_image.png"',
+                "Content-Encoding": "identity"
             }
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -556,7 +996,7 @@ async def generate_image(
 @app.post("/api/prompts/improve")
 async def improve_prompt(
     request: PromptImproveRequest,
-    authorization: str = Header(...)
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme)
 ):
     """
     Use AI to improve a Sora video prompt based on best practices
@@ -566,102 +1006,43 @@ async def improve_prompt(
 
     Returns an improved version of the prompt optimized for Sora video generation
     """
-    try:
-        client = get_openai_client(authorization)
-
-        system_prompt = """You are an expert at crafting prompts for OpenAI's Sora video generation model. Your job is to take a user's basic prompt and enhance it following the official Sora 2 Prompting Guide.
-
-CORE PRINCIPLES:
-
-1. CLARITY OVER VAGUENESS
-Transform vague descriptions into concrete, filmable details:
-- "beautiful street" → "wet asphalt, zebra crosswalk, neon signs reflecting in puddles"
-- "person moves" → "cyclist pedals three times, brakes at crosswalk"
-- "cinematic look" → "anamorphic 2.0x lens, shallow DOF, volumetric light"
-
-2. CAMERA & FRAMING
-Be specific about camera work:
-- Framing: wide establishing shot, medium close-up, aerial shot, etc.
-- Angle: eye level, low angle, slight downward angle, over-shoulder
-- Movement: slowly tilting camera, handheld ENG camera, slow dolly left, tracking shot
-- Depth of field: shallow (sharp subject, blurred background) or deep focus
-
-3. LIGHTING & COLOR
-Describe lighting with precision:
-- Quality: soft window light, hard single source, diffuse overhead
-- Direction: warm backlight, cool rim from hallway, key from camera left
-- Palette: Include 3-5 color anchors (amber, cream, walnut brown, slate blue, etc.)
-
-4. VISUAL STYLE & ERA
-Set a clear aesthetic tone:
-- Film types: "1970s film on 35mm," "16mm black-and-white documentary," "90s documentary-style"
-- Look: "hand-painted 2D/3D hybrid," "IMAX-scale," "vintage commercial"
-- Technical: "180° shutter," "slight gate weave," "natural flares," "soft focus"
-
-5. ACTION & TIMING
-Keep motion simple and break actions into clear beats:
-- One camera move + one subject action per shot
-- Use specific counts: "takes four steps to window, pauses, pulls curtain in final second"
-- Describe gestures precisely: "taps bulb; sparks crackle; flinches; drops bulb; catches it"
-
-6. MOTION CONTROL
-The model follows instructions more reliably in shorter clips. Keep shots concise with single, clear actions.
-
-7. DIALOGUE & SOUND
-- Format dialogue in a separate section below the prose
-- Keep lines brief and natural
-- Label speakers consistently in multi-character scenes
-- Background sound: suggest ambient audio (rain, traffic hiss, espresso machine hum)
-
-RECOMMENDED STRUCTURE:
-
-[Optional: Style note - film era, aesthetic, technical specs]
-
-[Prose scene description with specific visual details - characters, setting, weather, costumes]
-
-Cinematography:
-Camera shot: [specific framing and angle]
-Lens: [if relevant - 35mm, 50mm, etc.]
-Lighting: [quality, direction, and source]
-Mood: [overall tone]
-
-Actions:
-- [Action 1: specific beat with timing]
-- [Action 2: another clear gesture]
-- [Action 3: final movement or pause]
-
-Dialogue: [if applicable]
-- [Character name]: "[Brief, natural line]"
-- [Character name]: "[Response]"
-
-Background Sound: [if applicable]
-[Ambient audio cues - keep minimal and diegetic]
-
-IMPORTANT NOTES:
-- Shorter, lighter prompts give the model creative freedom (expect surprising results)
-- Longer, detailed prompts provide control but may not always be followed perfectly
-- Avoid describing multiple shots unless needed - focus on one clear shot
-- Characters: Keep descriptions consistent to maintain identity
-- Leave some details open for creative interpretation unless control is critical
+    # Validate credentials before consulting the cache so unauthenticated
+    # callers can't read cached improvements
+    client = get_openai_client(credentials)
+
+    # Identical prompts produce cacheable improvements, so skip the LLM call
+    # when we've already improved this exact prompt recently
+    cache_key = "improve:" + hashlib.sha256(
+        f"{SYSTEM_PROMPT_VERSION}|{request.prompt}".encode()
+    ).hexdigest()
+    if (cached := await cache_get(cache_key)) is not None:
+        return Response(content=cached, media_type="application/json",
+                        headers={"X-Cache": "HIT"})
 
-Return ONLY the improved prompt following this structure. No meta-commentary or explanations."""
-
-        response = client.chat.completions.create(
+    try:
+        await acquire_openai_slot(client)
+        response = await client.chat.completions.create(
             model="o3-mini",
             reasoning_effort="medium",
             messages=[
-                {"role": "system", "content": system_prompt},
+                {"role": "system", "content": SYSTEM_PROMPT},
                 {"role": "user", "content": f"Improve this Sora video prompt following the official Sora 2 Prompting Guide:\n\n{request.prompt}"}
             ]
         )
 
         improved_prompt = response.choices[0].message.content.strip()
 
-        return {
+        body = json.dumps({
             "original": request.prompt,
             "improved": improved_prompt
-        }
+        })
+        await cache_set(cache_key, body, IMPROVE_CACHE_TTL)
+
+        return Response(content=body, media_type="application/json",
+                        headers={"X-Cache": "MISS"})
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -679,6 +1060,11 @@ if static_dir.exists():
     # Mount static files
     app.mount("/assets", StaticFiles(directory=static_dir / "assets"), name="assets")
 
+    # Resolve index.html once at startup; checking existence per request is
+    # a stat syscall for an answer that never changes over the process life
+    INDEX_FILE = static_dir / "index.html"
+    HAS_INDEX = INDEX_FILE.exists()
+
     # Serve index.html for all other routes (SPA support)
     @app.get("/{full_path:path}")
     async def serve_spa(full_path: str):
@@ -687,9 +1073,8 @@ if static_dir.exists():
         if full_path.startswith("api/"):
             raise HTTPException(status_code=404, detail="Not found")
 
-        index_file = static_dir / "index.html"
-        if index_file.exists():
-            return FileResponse(index_file)
+        if HAS_INDEX:
+            return FileResponse(INDEX_FILE)
         raise HTTPException(status_code=404, detail="Not found")
 else:
     # In development mode, return health check at root
@@ -700,5 +1085,17 @@ else:
 
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+
+    # uvloop and httptools (both bundled with uvicorn[standard]) give a
+    # 2-3x request-throughput boost over the default asyncio loop + h11
+    # parser; uvloop is POSIX-only, so fall back on Windows
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop" if sys.platform != "win32" else "asyncio",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "2"))
+    )